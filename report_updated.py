@@ -1,8 +1,297 @@
+import io
+import concurrent.futures
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
+import openpyxl
 from datetime import datetime
 
+try:
+    import python_calamine  # noqa: F401  (Rust reader behind pandas' "calamine" engine)
+    HAS_CALAMINE = True
+except ImportError:
+    HAS_CALAMINE = False
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# ==============================
+# Data loading
+# ==============================
+# Source columns the dashboard uses, and their short names
+COLUMN_NAMES = {
+    "User Role": "Role",
+    "User Name": "User",
+    "Assigned Area": "Area",
+    "Assigned Region": "Region",
+    "Check-In Time": "CheckInTime",
+    "Check-In Date": "CheckInDate"
+}
+
+
+def is_needed_column(name) -> bool:
+    # Callable usecols: files lacking some columns still load, unused ones are skipped
+    return name in COLUMN_NAMES
+
+
+def read_workbook(file_bytes: bytes) -> pd.DataFrame:
+    if HAS_CALAMINE:
+        return pd.read_excel(io.BytesIO(file_bytes), engine="calamine", usecols=is_needed_column)
+    if not file_bytes.startswith(b"PK"):
+        # Legacy .xls is not a zip container, openpyxl cannot stream it
+        return pd.read_excel(io.BytesIO(file_bytes), usecols=is_needed_column)
+
+    # Stream the first sheet row by row instead of building the full workbook
+    wb = openpyxl.load_workbook(io.BytesIO(file_bytes), read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, ())
+        keep = [i for i, name in enumerate(header) if is_needed_column(name)]
+        return pd.DataFrame([[row[i] for i in keep] for row in rows],
+                            columns=[header[i] for i in keep])
+    finally:
+        wb.close()
+
+
+# Sentinel _secs for rows without a Check-In Time, later than any threshold
+MISSING_CHECKIN_SECS = np.iinfo(np.int32).max
+
+
+# Cached on the raw file bytes so widget reruns skip Excel parsing entirely.
+@st.cache_data(show_spinner=False)
+def load_and_prepare(file_bytes: bytes) -> pd.DataFrame:
+    df = read_workbook(file_bytes)
+
+    # Rename columns consistently
+    df = df.rename(columns=COLUMN_NAMES)
+
+    # Parse date and time. CheckInDate stays datetime64 (no .dt.date) so that
+    # month truncation and any date math remain vectorized.
+    df["CheckInDate"] = pd.to_datetime(df["CheckInDate"])
+    df["CheckInTime"] = pd.to_datetime(df["CheckInTime"])
+
+    # Seconds since midnight, so the threshold check is a plain int compare.
+    # A blank Check-In Time is kept as a row but counted as late: it gets a sentinel
+    # above any time of day, so it never passes "<= threshold".
+    check_in = df["CheckInTime"].dt
+    secs = (check_in.hour.to_numpy() * 3600
+            + check_in.minute.to_numpy() * 60
+            + check_in.second.to_numpy())
+    missing = df["CheckInTime"].isna().to_numpy()
+    df["_secs"] = np.where(missing, MISSING_CHECKIN_SECS, secs).astype(np.int32)
+
+    return df
+
+
+# ==============================
+# Aggregations
+# ==============================
+def count_checkins(codes: np.ndarray, n_groups: int, not_on_time: np.ndarray):
+    # Total and false check-ins per integer group code via bincount, no groupby machinery.
+    # Code -1 (missing label) is dropped, matching groupby's default dropna.
+    valid = codes >= 0
+    if not valid.all():
+        codes, not_on_time = codes[valid], not_on_time[valid]
+    totals = np.bincount(codes, minlength=n_groups)
+    falses = np.bincount(codes, weights=not_on_time, minlength=n_groups).astype(np.int64)
+    return totals, falses
+
+
+if HAS_NUMBA:
+    # cache=True keeps the compiled kernel on disk: Streamlit re-executes this file on
+    # every rerun, so it must not be recompiled each time. Serial and nogil on purpose:
+    # every session runs the script in its own thread, and numba's parallel threading
+    # layers are not safe to launch concurrently from such threads.
+    @numba.njit(nogil=True, cache=True)
+    def _count_by_group_jit(group_ids, not_on_time, n_groups):
+        totals = np.zeros(n_groups, dtype=np.int64)
+        falses = np.zeros(n_groups, dtype=np.int64)
+        for i in range(group_ids.size):
+            g = group_ids[i]
+            totals[g] += 1
+            falses[g] += not_on_time[i]
+        return totals, falses
+
+
+def add_false_pct(stats: pd.DataFrame) -> None:
+    # Per-group counts fit in int32; narrower columns halve the bytes the divide reads.
+    # False_% itself stays float64 so the rounded labels render exactly (e.g. 33.3).
+    counts = ["Total_Checkins", "False_Checkins"]
+    stats[counts] = stats[counts].astype(np.int32)
+    stats["False_%"] = np.round(stats["False_Checkins"].to_numpy() /
+                                stats["Total_Checkins"].to_numpy() * 100, 1)
+
+
+def count_by_group(group_ids: np.ndarray, n_groups: int, not_on_time: np.ndarray):
+    if HAS_NUMBA:
+        return _count_by_group_jit(np.ascontiguousarray(group_ids, dtype=np.intp),
+                                   np.ascontiguousarray(not_on_time, dtype=np.int32),
+                                   n_groups)
+    return count_checkins(group_ids, n_groups, not_on_time)
+
+
+# Returns the (Month, dimension, User) stats sorted by key, RA totals per
+# (Month, dimension), and the row offsets where each month starts in the stats.
+def compute_ra_stats(df_ra: pd.DataFrame, not_on_time: np.ndarray, group_by_choice: str):
+    month = df_ra["Month"].cat.codes.to_numpy().astype(np.int64)
+    dim = df_ra[group_by_choice].cat.codes.to_numpy().astype(np.int64)
+    user = df_ra["User"].cat.codes.to_numpy().astype(np.int64)
+
+    # Rows with a missing label are dropped, as groupby does
+    valid = (month >= 0) & (dim >= 0) & (user >= 0)
+    if not valid.all():
+        month, dim, user, not_on_time = month[valid], dim[valid], user[valid], not_on_time[valid]
+
+    levels = [df_ra["Month"].cat.categories,
+              df_ra[group_by_choice].cat.categories,
+              df_ra["User"].cat.categories]
+    month_bits, dim_bits, user_bits = (max(len(level).bit_length(), 1) for level in levels)
+
+    if month_bits + dim_bits + user_bits <= 63:
+        # Pack (Month, dimension, User) into one int64 key sized to the label counts;
+        # sorted factorize keeps groupby order
+        keys = (month << (dim_bits + user_bits)) | (dim << user_bits) | user
+        group_ids, uniques = pd.factorize(keys, sort=True)
+        totals, falses = count_by_group(group_ids, len(uniques), not_on_time)
+        codes = [uniques >> (dim_bits + user_bits),
+                 (uniques >> user_bits) & ((1 << dim_bits) - 1),
+                 uniques & ((1 << user_bits) - 1)]
+    else:
+        # Too many labels to fit one int64 key, group on the codes instead
+        grouped = (
+            pd.DataFrame({"month": month, "dim": dim, "user": user, "false": not_on_time})
+            .groupby(["month", "dim", "user"], sort=True)["false"]
+            .agg(["size", "sum"])
+        )
+        totals, falses = grouped["size"].to_numpy(), grouped["sum"].to_numpy().astype(np.int64)
+        codes = [grouped.index.get_level_values(k).to_numpy() for k in range(3)]
+
+    index = pd.MultiIndex(levels=levels, codes=codes, names=["Month", group_by_choice, "User"])
+    ra_stats = pd.DataFrame({"Total_Checkins": totals, "False_Checkins": falses}, index=index)
+    add_false_pct(ra_stats)
+
+    # One row per (Month, dimension, User), so group sizes are the RA totals
+    ra_per_area = ra_stats.groupby(level=["Month", group_by_choice], observed=True).size()
+    n_months = len(index.levels[0])
+    month_bounds = np.searchsorted(index.codes[0], np.arange(n_months + 1))
+    return ra_stats, ra_per_area, month_bounds
+
+
+# ==============================
+# Derived tables
+# ==============================
+def memoize(file_sig: tuple, key: tuple, compute):
+    # Keep derived tables in session_state across reruns, keyed by the inputs each one
+    # depends on, so a widget change only recomputes the tables whose key changed.
+    # Everything is dropped when the uploads change. Entries are shared, never mutate them.
+    memo = st.session_state.get("derived")
+    if memo is None or memo["file_sig"] != file_sig:
+        memo = st.session_state["derived"] = {"file_sig": file_sig, "tables": {}}
+    if key not in memo["tables"]:
+        memo["tables"][key] = compute()
+    return memo["tables"][key]
+
+
+# Memo entries whose key is (name, threshold_secs, ...)
+THRESHOLD_TABLES = ("ontime", "months", "dimension", "ra_stats")
+
+
+def forget_other_thresholds(threshold_secs: int) -> None:
+    # Only the current threshold's tables are kept, so trying thresholds does not pile up
+    memo = st.session_state.get("derived")
+    if memo is None:
+        return
+    stale = [key for key in memo["tables"]
+             if key[0] in THRESHOLD_TABLES and key[1] != threshold_secs]
+    for key in stale:
+        del memo["tables"][key]
+
+
+def combine_uploads(uploaded_files) -> pd.DataFrame:
+    # Parse the files concurrently; calamine releases the GIL while reading. Threads
+    # rather than processes: functions defined in a Streamlit script cannot be pickled
+    # into worker processes, so the openpyxl fallback stays GIL-bound here.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(uploaded_files))) as executor:
+        dfs = list(executor.map(load_and_prepare, [file.getvalue() for file in uploaded_files]))
+
+    # Combine all months
+    df = pd.concat(dfs, ignore_index=True)
+
+    # Low-cardinality labels as categoricals: filters and groupbys work on int codes.
+    # Done after concat, since files with different labels would concat to object.
+    for col in ("Role", "Area", "Region", "User"):
+        df[col] = df[col].astype("category")
+
+    # Add Month-Year column: a datetime64[M] cast, only the unique months get formatted.
+    # Blank dates (NaT) get code -1, i.e. a missing Month, so they drop out like dropna.
+    month_floor = df["CheckInDate"].to_numpy().astype("datetime64[M]")
+    dated = ~np.isnat(month_floor)
+    month_values, dated_codes = np.unique(month_floor[dated], return_inverse=True)
+    month_codes = np.full(len(df), -1, dtype=np.intp)
+    month_codes[dated] = dated_codes
+    df["Month"] = pd.Categorical.from_codes(
+        month_codes, categories=np.datetime_as_string(month_values, unit="M"), ordered=True
+    )
+
+    # Rows sorted by Month once, so per-month groupbys can skip sorting (sort=False)
+    # and still come out in month order while scanning contiguous runs
+    df = df.sort_values("Month", kind="stable").reset_index(drop=True)
+    return df
+
+
+def summarize_users(df: pd.DataFrame, df_ra: pd.DataFrame):
+    # Threshold-independent: only Role and User are involved
+    total_ra = df_ra["User"].nunique()
+    df_sup = df[df["Role"] == "SUP"]
+    total_sup = df_sup["User"].nunique()
+    ra_per_month = df_ra.groupby("Month", sort=False, observed=True)["User"].nunique()
+    sup_per_month = df_sup.groupby("Month", sort=False, observed=True)["User"].nunique()
+    return total_ra, total_sup, ra_per_month, sup_per_month
+
+
+def summarize_months(df: pd.DataFrame, not_on_time: np.ndarray,
+                     ra_per_month: pd.Series, sup_per_month: pd.Series):
+    months = df["Month"].cat.categories
+    month_codes = df["Month"].cat.codes.to_numpy()
+    month_totals, month_falses = count_checkins(month_codes, len(months), not_on_time)
+    month_summary = pd.DataFrame({
+        "Month": months,
+        "Total_Checkins": month_totals,
+        "False_Checkins": month_falses
+    })
+    add_false_pct(month_summary)
+
+    # The monthly table is the trend table plus RA/SUP user counts
+    monthly_summary = month_summary.assign(
+        RA_Count=ra_per_month.reindex(months, fill_value=0).to_numpy(),
+        SUP_Count=sup_per_month.reindex(months, fill_value=0).to_numpy()
+    )
+    return monthly_summary, month_summary
+
+
+def summarize_dimension(df: pd.DataFrame, not_on_time: np.ndarray,
+                        group_by_choice: str) -> pd.DataFrame:
+    # Dense (Month, dimension) key: one bincount pass covers every month
+    months = df["Month"].cat.categories
+    month_codes = df["Month"].cat.codes.to_numpy()
+    dims = df[group_by_choice].cat.categories
+    dim_codes = df[group_by_choice].cat.codes.to_numpy()
+    pair_codes = np.where((month_codes >= 0) & (dim_codes >= 0),
+                          month_codes.astype(np.int64) * len(dims) + dim_codes, -1)
+    pair_totals, pair_falses = count_checkins(pair_codes, len(months) * len(dims), not_on_time)
+    observed = pair_totals > 0
+    all_stats = pd.DataFrame(
+        {"Total_Checkins": pair_totals[observed], "False_Checkins": pair_falses[observed]},
+        index=pd.MultiIndex.from_product([months, dims], names=["Month", group_by_choice])[observed]
+    )
+    add_false_pct(all_stats)
+    return all_stats
+
+
 # ==============================
 # Streamlit App
 # ==============================
@@ -22,28 +311,9 @@ uploaded_files = st.file_uploader(
 )
 
 if uploaded_files:
-    dfs = []
-    for file in uploaded_files:
-        df = pd.read_excel(file)
-
-        # Rename columns consistently
-        df = df.rename(columns={
-            "User Role": "Role",
-            "User Name": "User",
-            "Assigned Area": "Area",
-            "Assigned Region": "Region",
-            "Check-In Time": "CheckInTime",
-            "Check-In Date": "CheckInDate"
-        })
-
-        # Parse date and time
-        df["CheckInDate"] = pd.to_datetime(df["CheckInDate"]).dt.date
-        df["CheckInTime"] = pd.to_datetime(df["CheckInTime"]).dt.time
-
-        dfs.append(df)
-
-    # Combine all months
-    df = pd.concat(dfs, ignore_index=True)
+    file_sig = tuple(file.file_id for file in uploaded_files)
+    df = memoize(file_sig, ("data",), lambda: combine_uploads(uploaded_files))
+    months = df["Month"].cat.categories
 
     # ==============================
     # Configurable threshold time
@@ -53,11 +323,17 @@ if uploaded_files:
         value=datetime.strptime("09:00:00", "%H:%M:%S").time()
     )
 
-    # Compute OnTime column
-    df["OnTime"] = df["CheckInTime"].apply(lambda t: t <= threshold_time)
+    # Compute the OnTime flags. They are kept off the shared df and passed to the
+    # aggregations explicitly; only the current threshold's tables stay memoized.
+    threshold_secs = (threshold_time.hour * 3600
+                      + threshold_time.minute * 60
+                      + threshold_time.second)
+    forget_other_thresholds(threshold_secs)
+    def flag_ontime():
+        ontime = df["_secs"].to_numpy() <= threshold_secs
+        return ontime, (~ontime).astype(np.int32)
 
-    # Add Month-Year column
-    df["Month"] = pd.to_datetime(df["CheckInDate"]).dt.strftime("%Y-%m")
+    ontime, not_on_time = memoize(file_sig, ("ontime", threshold_secs), flag_ontime)
 
     # ==============================
     # Dimension selector
@@ -72,10 +348,21 @@ if uploaded_files:
     # Overall Summary Metrics
     # ==============================
     st.subheader("Overall Summary Across All Months")
-    total_ra = df[df["Role"] == "RA"]["User"].nunique()
-    total_sup = df[df["Role"] == "SUP"]["User"].nunique()
-    total_checkins = len(df)
-    total_true = df["OnTime"].sum()
+
+    # RA rows feed most tables below. Which rows are RA does not depend on the threshold,
+    # so the positions and the RA view are memoized once; flags are indexed per rerun.
+    ra_rows = memoize(file_sig, ("ra_rows",), lambda: np.flatnonzero((df["Role"] == "RA").to_numpy()))
+    df_ra = memoize(file_sig, ("ra_frame",), lambda: df.iloc[ra_rows])
+    total_ra, total_sup, ra_per_month, sup_per_month = memoize(
+        file_sig, ("users",), lambda: summarize_users(df, df_ra)
+    )
+    monthly_summary, month_summary = memoize(
+        file_sig, ("months", threshold_secs),
+        lambda: summarize_months(df, not_on_time, ra_per_month, sup_per_month)
+    )
+
+    total_checkins = ontime.size
+    total_true = int(ontime.sum())
     total_false = total_checkins - total_true
     true_pct = (total_true / total_checkins * 100) if total_checkins else 0
     false_pct = (total_false / total_checkins * 100) if total_checkins else 0
@@ -94,16 +381,6 @@ if uploaded_files:
     # ==============================
     st.subheader("Monthly Summary for All Uploaded Months")
 
-    monthly_summary = df.groupby("Month").apply(
-        lambda g: pd.Series({
-            "Total_Checkins": len(g),
-            "False_Checkins": (g["OnTime"] == False).sum(),
-            "False_%": round((g["OnTime"] == False).sum() / len(g) * 100, 1) if len(g) else 0,
-            "RA_Count": g[g["Role"] == "RA"]["User"].nunique(),
-            "SUP_Count": g[g["Role"] == "SUP"]["User"].nunique()
-        })
-    ).reset_index()
-
     st.dataframe(
         monthly_summary.sort_values("Month"),
         use_container_width=True
@@ -113,13 +390,6 @@ if uploaded_files:
     # Monthly False Check-in Trend
     # ==============================
     st.subheader("Monthly False Check-in Trend")
-    month_summary = df.groupby("Month").agg(
-        Total_Checkins=("OnTime", "count"),
-        False_Checkins=("OnTime", lambda x: (x == False).sum())
-    ).reset_index()
-    month_summary["False_%"] = (month_summary["False_Checkins"] /
-                                month_summary["Total_Checkins"] * 100).round(1)
-
     fig_month = px.line(
         month_summary,
         x="Month",
@@ -135,8 +405,7 @@ if uploaded_files:
     # Monthly RA Count Trend
     # ==============================
     st.subheader("Monthly RA Count Trend")
-    ra_month_summary = df[df["Role"] == "RA"].groupby("Month")["User"].nunique().reset_index()
-    ra_month_summary = ra_month_summary.rename(columns={"User": "RA_Count"})
+    ra_month_summary = ra_per_month.rename("RA_Count").reset_index()
 
     fig_ra_month = px.line(
         ra_month_summary,
@@ -153,38 +422,45 @@ if uploaded_files:
     # Per-Month Detailed Analysis
     # ==============================
     st.subheader(f"Detailed Monthly Analysis by {group_by_choice}")
-    months = sorted(df["Month"].unique())
-    for m in months:
+
+    all_stats = memoize(file_sig, ("dimension", threshold_secs, group_by_choice),
+                        lambda: summarize_dimension(df, not_on_time, group_by_choice))
+
+    for m, month_stats in all_stats.groupby(level="Month", observed=True):
         st.markdown(f"### {m}")
-        mdf = df[df["Month"] == m]
-        
-        group_summary = mdf.groupby(group_by_choice).agg(
-            Total_Checkins=("OnTime", "count"),
-            False_Checkins=("OnTime", lambda x: (x == False).sum())
-        ).reset_index()
-        group_summary["False_%"] = (group_summary["False_Checkins"] /
-                                    group_summary["Total_Checkins"] * 100).round(1)
-        st.dataframe(group_summary.sort_values("False_%", ascending=False),
-                     use_container_width=True)
-
-        fig1 = px.bar(
-            group_summary.sort_values("False_%", ascending=False),
-            x="False_%",
-            y=group_by_choice,
-            orientation='h',
-            text="False_%",
-            color="False_%",
-            color_continuous_scale="RdYlGn_r",
-            labels={"False_%": "False %", group_by_choice: group_by_choice},
-            title=f"False Check-ins by {group_by_choice} - {m}"
-        )
-        fig1.update_layout(
-            yaxis=dict(autorange="reversed"),
-            height=50 * len(group_summary),
-            margin=dict(l=150, r=50, t=50, b=50)
-        )
-        fig1.update_traces(textposition='outside', marker_line_width=0.5, marker_line_color='black')
-        st.plotly_chart(fig1, use_container_width=True)
+        group_summary = month_stats.droplevel("Month").reset_index()
+        group_summary = group_summary.sort_values("False_%", ascending=False)
+        st.dataframe(group_summary, use_container_width=True)
+
+    # One faceted figure for all months instead of a separate chart per month
+    plot_stats = all_stats.reset_index().sort_values(["Month", "False_%"], ascending=[True, False])
+    # Fixed pixel gap between facets; plotly takes the spacing as a fraction of the height
+    n_rows = all_stats.index.get_level_values("Month").nunique()
+    gap_px = 30
+    fig1_height = 50 * len(plot_stats) + gap_px * max(n_rows - 1, 0)
+    fig1 = px.bar(
+        plot_stats,
+        x="False_%",
+        y=group_by_choice,
+        facet_row="Month",
+        facet_row_spacing=gap_px / max(fig1_height, 1),
+        category_orders={"Month": list(months)},
+        orientation='h',
+        text="False_%",
+        color="False_%",
+        color_continuous_scale="RdYlGn_r",
+        labels={"False_%": "False %", group_by_choice: group_by_choice},
+        title=f"False Check-ins by {group_by_choice} per Month"
+    )
+    fig1.update_layout(
+        height=fig1_height,
+        margin=dict(l=150, r=50, t=50, b=50)
+    )
+    # Each month keeps its own reversed category axis, as the per-month charts did
+    fig1.update_yaxes(matches=None, autorange="reversed")
+    fig1.for_each_annotation(lambda a: a.update(text=a.text.split("=")[-1]))
+    fig1.update_traces(textposition='outside', marker_line_width=0.5, marker_line_color='black')
+    st.plotly_chart(fig1, use_container_width=True)
 
     # ==============================
     # Late RA Users Threshold Across Months
@@ -192,28 +468,32 @@ if uploaded_files:
     st.subheader("Late RA Users per Month")
     threshold = st.slider("Select False % Threshold", 0, 100, 60, step=5)
 
-    for m in months:
+    # Memoized per session, so the False % slider never regroups
+    ra_stats, ra_per_area, month_bounds = memoize(
+        file_sig, ("ra_stats", threshold_secs, group_by_choice),
+        lambda: compute_ra_stats(df_ra, not_on_time[ra_rows], group_by_choice)
+    )
+
+    # Slider moves only slice the cached, month-sorted stats and apply a NumPy mask
+    for i, m in enumerate(months):
         st.markdown(f"### {m}")
-        mdf = df[(df["Month"] == m) & (df["Role"] == "RA")]
-        ra_users = mdf.groupby([group_by_choice, "User"]).agg(
-            Total_Checkins=("OnTime", "count"),
-            False_Checkins=("OnTime", lambda x: (x == False).sum())
-        ).reset_index()
-        ra_users["False_%"] = (ra_users["False_Checkins"] /
-                               ra_users["Total_Checkins"] * 100).round(1)
-        filtered_ra = ra_users[ra_users["False_%"] >= threshold]
-        st.dataframe(filtered_ra.sort_values("False_%", ascending=False),
-                     use_container_width=True)
+        ra_users = ra_stats.iloc[month_bounds[i]:month_bounds[i + 1]]
+        late_mask = ra_users["False_%"].to_numpy() >= threshold
+        filtered_ra = ra_users.iloc[late_mask].droplevel("Month").reset_index()
+        filtered_ra = filtered_ra.sort_values("False_%", ascending=False)
+        st.dataframe(filtered_ra, use_container_width=True)
 
         if not filtered_ra.empty:
-            area_late_count = filtered_ra.groupby(group_by_choice)["User"].nunique().reset_index()
+            area_late_count = filtered_ra.groupby(group_by_choice, observed=True)["User"].nunique().reset_index()
             area_late_count = area_late_count.rename(columns={"User": "RA_Count"})
-            total_ra_per_area = mdf.groupby(group_by_choice)["User"].nunique()
-            area_late_count["Percent"] = area_late_count.apply(
-                lambda x: round((x["RA_Count"] / total_ra_per_area[x[group_by_choice]]) * 100, 1), axis=1
+            total_ra_per_area = ra_per_area.xs(m, level="Month")
+            area_total_ra = area_late_count[group_by_choice].map(total_ra_per_area).to_numpy(dtype=np.int64)
+            area_late_count["Percent"] = np.round(
+                area_late_count["RA_Count"].to_numpy() / area_total_ra * 100, 1
             )
-            area_late_count["Area_Label"] = area_late_count.apply(
-                lambda x: f"{x[group_by_choice]} (Total RA: {total_ra_per_area[x[group_by_choice]]})", axis=1
+            area_late_count["Area_Label"] = (
+                area_late_count[group_by_choice].astype(str)
+                + " (Total RA: " + pd.Series(area_total_ra, index=area_late_count.index).astype(str) + ")"
             )
             area_late_count = area_late_count.sort_values("RA_Count", ascending=False)
 
@@ -222,7 +502,8 @@ if uploaded_files:
                 x="RA_Count",
                 y="Area_Label",
                 orientation='h',
-                text=area_late_count.apply(lambda x: f"{x['RA_Count']} ({x['Percent']}%)", axis=1),
+                text=(area_late_count["RA_Count"].astype(str)
+                      + " (" + area_late_count["Percent"].astype(str) + "%)"),
                 color="RA_Count",
                 color_continuous_scale="RdYlGn_r",
                 labels={"RA_Count": "Number of Late RA Users", "Area_Label": group_by_choice},